@@ -1,10 +1,168 @@
+import queue
+import re
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 
-DB_PATH = Path(__file__).resolve().parents[2] / "data" / "procurement.db"
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+DB_PATH = DATA_DIR / "procurement.db"
 
-def get_connection():
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+# Multi-tenant layout: one SQLite file (shard) per tenant + a small registry DB
+TENANT_DB_DIR = DATA_DIR / "tenants"
+REGISTRY_DB_PATH = DATA_DIR / "tenant_registry.db"
+
+POOL_SIZE = 4
+_TENANT_ID_RE = re.compile(r"^[a-z0-9][a-z0-9_-]{0,62}$")
+
+_pools = {}
+_bootstrapped = set()
+_bootstrapping = set()
+_bootstrap_locks = {}
+_lock = threading.Lock()
+
+
+def _connect(path: Path, wal: bool = False):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False)
     conn.row_factory = sqlite3.Row
-    return conn
\ No newline at end of file
+    if wal:
+        # WAL lets readers keep going while a tenant is writing
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def validate_tenant_id(tenant_id: str) -> str:
+    """
+    Tenant ids become file names, so keep them to a safe slug.
+    """
+    if not isinstance(tenant_id, str) or not _TENANT_ID_RE.match(tenant_id):
+        raise ValueError(
+            f"Invalid tenant id {tenant_id!r}: use lowercase letters, digits, '-' or '_'."
+        )
+    return tenant_id
+
+
+def tenant_db_path(tenant_id: str) -> Path:
+    return TENANT_DB_DIR / f"{validate_tenant_id(tenant_id)}.db"
+
+
+def get_registry_connection():
+    return _connect(REGISTRY_DB_PATH)
+
+
+def _ensure_schema(tenant_id: str):
+    """
+    Lazily create tables the first time this process touches a tenant shard.
+    Other threads opening the same new shard wait until the tables exist.
+    """
+    with _lock:
+        if tenant_id in _bootstrapped:
+            return
+        tenant_lock = _bootstrap_locks.setdefault(tenant_id, threading.RLock())
+
+    with tenant_lock:
+        # create_tables() itself calls get_connection(tenant_id) on this thread
+        if tenant_id in _bootstrapped or tenant_id in _bootstrapping:
+            return
+        _bootstrapping.add(tenant_id)
+
+        # Local import: schema.py imports this module
+        from app.db.schema import create_tables
+
+        try:
+            create_tables(tenant_id)
+            with _lock:
+                _bootstrapped.add(tenant_id)
+        finally:
+            _bootstrapping.discard(tenant_id)
+
+
+def _resolve_shard(tenant_id: str) -> Path:
+    """
+    Shard file of an active registered tenant. Unknown / inactive ids are an error,
+    so a typo never creates a new empty shard.
+    """
+    validate_tenant_id(tenant_id)
+
+    # Local import: tenants.py imports this module
+    from app.db.tenants import get_active_tenant
+
+    tenant = get_active_tenant(tenant_id)
+    if tenant is None:
+        raise ValueError(f"Unknown or inactive tenant {tenant_id!r}.")
+    return TENANT_DB_DIR / tenant["db_file"]
+
+
+def get_connection(tenant_id: str = None):
+    """
+    Open a connection to the tenant's shard.
+    Without a tenant id this is the single shared database (legacy / dev mode).
+    """
+    if tenant_id is None:
+        return _connect(DB_PATH)
+
+    conn = _connect(_resolve_shard(tenant_id), wal=True)
+    _ensure_schema(tenant_id)
+    return conn
+
+
+def _get_pool(tenant_id: str):
+    key = tenant_id or ""
+    with _lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = queue.LifoQueue(maxsize=POOL_SIZE)
+            _pools[key] = pool
+    return pool
+
+
+def acquire_connection(tenant_id: str = None):
+    """
+    Take a connection from the shard's pool (or open a new one if the pool is empty).
+    Hand it back with release_connection() instead of closing it.
+    """
+    try:
+        return _get_pool(tenant_id).get_nowait()
+    except queue.Empty:
+        return get_connection(tenant_id)
+
+
+def release_connection(conn, tenant_id: str = None):
+    """
+    Return a connection to the shard's pool. Extra connections beyond POOL_SIZE are closed.
+    """
+    try:
+        conn.rollback()
+        _get_pool(tenant_id).put_nowait(conn)
+    except queue.Full:
+        conn.close()
+
+
+@contextmanager
+def pooled_connection(tenant_id: str = None):
+    conn = acquire_connection(tenant_id)
+    try:
+        yield conn
+    finally:
+        release_connection(conn, tenant_id)
+
+
+def close_pools(tenant_id: str = None):
+    """
+    Close pooled connections for one tenant, or for every shard when no tenant is given.
+    """
+    with _lock:
+        if tenant_id is None:
+            pools = list(_pools.values())
+            _pools.clear()
+        else:
+            pool = _pools.pop(tenant_id, None)
+            pools = [pool] if pool is not None else []
+    for pool in pools:
+        while True:
+            try:
+                pool.get_nowait().close()
+            except queue.Empty:
+                break
@@ -0,0 +1,51 @@
+from app.db.scorecards import record_decision
+
+
+def save_decision(cur, rfq_id: int, selected_vendor_id: int, selected_by: str, override_reason,
+                  recommended_vendor_id: int, cheapest_vendor_id: int, weights: str,
+                  frontier_rows=()):
+    """
+    Save/update the decision for an RFQ together with its recommendation snapshot,
+    frozen frontier / shortlist and vendor scorecard counters. Caller commits.
+    frontier_rows: (quote_id, vendor_id, final_score, on_frontier, shortlist_rank) tuples.
+    """
+    # Save/Update snapshot
+    cur.execute(
+        """
+        INSERT INTO rfq_recommendation_snapshot (rfq_id, recommended_vendor_id, cheapest_vendor_id, weights)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(rfq_id) DO UPDATE SET
+          recommended_vendor_id=excluded.recommended_vendor_id,
+          cheapest_vendor_id=excluded.cheapest_vendor_id,
+          weights=excluded.weights,
+          created_on=datetime('now')
+        """,
+        (rfq_id, recommended_vendor_id, cheapest_vendor_id, weights)
+    )
+
+    # Save/Replace frontier + shortlist for this snapshot
+    cur.execute("DELETE FROM rfq_recommendation_frontier WHERE rfq_id = ?", (rfq_id,))
+    cur.executemany(
+        """
+        INSERT INTO rfq_recommendation_frontier (rfq_id, quote_id, vendor_id, final_score, on_frontier, shortlist_rank)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        [(rfq_id, *row) for row in frontier_rows]
+    )
+
+    # Save/Update decision
+    cur.execute(
+        """
+        INSERT INTO rfq_decision (rfq_id, selected_vendor_id, selected_by, override_reason)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(rfq_id) DO UPDATE SET
+          selected_vendor_id=excluded.selected_vendor_id,
+          selected_by=excluded.selected_by,
+          override_reason=excluded.override_reason,
+          created_on=datetime('now')
+        """,
+        (rfq_id, selected_vendor_id, selected_by, override_reason)
+    )
+
+    # Update vendor scorecards for the vendors on this RFQ
+    record_decision(cur, rfq_id)
@@ -0,0 +1,196 @@
+import argparse
+import csv
+import gzip
+import sys
+import time
+from pathlib import Path
+
+from app.db.database import get_connection
+
+# Governance / audit view - also used by the dashboard's "Compact Governance View".
+# Deviation is decided here (by vendor id) so the report and the dashboard agree.
+GOVERNANCE_QUERY = """
+SELECT
+  rfq.rfq_id,
+  pr.pr_id,
+  rm.rm_name,
+  vcheap.vendor_name AS cheapest_vendor,
+  vrec.vendor_name   AS recommended_vendor,
+  vsel.vendor_name   AS selected_vendor,
+  CASE
+    WHEN d.selected_vendor_id IS NULL THEN 'Pending'
+    WHEN d.selected_vendor_id = s.recommended_vendor_id THEN 'Match'
+    ELSE 'Deviated'
+  END AS deviation,
+  d.override_reason,
+  d.selected_by,
+  d.created_on AS decision_time
+FROM rfq
+JOIN pr ON rfq.pr_id = pr.pr_id
+JOIN rm_master rm ON pr.rm_id = rm.rm_id
+LEFT JOIN rfq_recommendation_snapshot s ON s.rfq_id = rfq.rfq_id
+LEFT JOIN vendors vcheap ON s.cheapest_vendor_id = vcheap.vendor_id
+LEFT JOIN vendors vrec   ON s.recommended_vendor_id = vrec.vendor_id
+LEFT JOIN rfq_decision d ON d.rfq_id = rfq.rfq_id
+LEFT JOIN vendors vsel   ON d.selected_vendor_id = vsel.vendor_id
+ORDER BY rfq.rfq_id DESC
+"""
+
+BATCH_SIZE = 5000
+XLSX_MAX_ROWS = 1_048_576  # Excel sheet limit (incl. header row)
+
+
+def iter_governance_batches(conn, batch_size: int = BATCH_SIZE):
+    """
+    Yield row batches from a single cursor using fetchmany,
+    so only one batch is held in memory at a time.
+    """
+    cur = conn.cursor()
+    cur.execute(GOVERNANCE_QUERY)
+
+    while True:
+        rows = cur.fetchmany(batch_size)
+        if not rows:
+            break
+        yield [tuple(r) for r in rows]
+
+
+def governance_columns(conn):
+    cur = conn.execute(GOVERNANCE_QUERY + " LIMIT 0")
+    return [c[0] for c in cur.description]
+
+
+def write_csv(conn, fileobj, batch_size: int = BATCH_SIZE, progress=None) -> int:
+    """
+    Stream the governance view as CSV into an open text file. Returns row count.
+    """
+    writer = csv.writer(fileobj)
+    writer.writerow(governance_columns(conn))
+
+    total = 0
+    for rows in iter_governance_batches(conn, batch_size):
+        writer.writerows(rows)
+        total += len(rows)
+        if progress:
+            progress(total)
+    return total
+
+
+def write_xlsx(conn, path, batch_size: int = BATCH_SIZE, progress=None) -> int:
+    """
+    Stream the governance view into an XLSX using openpyxl's write-only mode.
+    Rolls over to a new sheet when Excel's row limit is reached. Returns row count.
+    """
+    try:
+        from openpyxl import Workbook
+    except ImportError as e:
+        raise RuntimeError("XLSX export needs openpyxl (pip install openpyxl).") from e
+
+    columns = governance_columns(conn)
+    wb = Workbook(write_only=True)
+
+    def new_sheet(n):
+        ws = wb.create_sheet(title="Governance" if n == 1 else f"Governance {n}")
+        ws.append(columns)
+        return ws
+
+    sheet_no = 1
+    ws = new_sheet(sheet_no)
+    sheet_rows = 1
+
+    total = 0
+    for rows in iter_governance_batches(conn, batch_size):
+        for row in rows:
+            if sheet_rows >= XLSX_MAX_ROWS:
+                sheet_no += 1
+                ws = new_sheet(sheet_no)
+                sheet_rows = 1
+            ws.append(row)
+            sheet_rows += 1
+        total += len(rows)
+        if progress:
+            progress(total)
+
+    wb.save(path)
+    return total
+
+
+def make_progress_reporter(emit, interval: float = 1.0):
+    """
+    Progress callback for export_governance(): calls emit(message) with rows written
+    and the running rows/sec, at most once per `interval` seconds.
+    """
+    start = time.perf_counter()
+    last = [start]
+
+    def report(rows: int):
+        now = time.perf_counter()
+        if now - last[0] < interval:
+            return
+        last[0] = now
+        rate = rows / (now - start) if now > start else float(rows)
+        emit(f"{rows:,} rows ({rate:,.0f} rows/sec)")
+
+    return report
+
+
+def export_governance(path, fmt: str = "csv", gzip_output: bool = False,
+                      tenant_id: str = None, batch_size: int = BATCH_SIZE, progress=None) -> dict:
+    """
+    Export the full governance / audit view to a file with bounded memory.
+    fmt: 'csv' or 'xlsx'. gzip_output only applies to CSV (XLSX is already zipped).
+    Returns {"path", "rows", "seconds", "rows_per_sec"}.
+    """
+    fmt = fmt.lower()
+    if fmt not in ("csv", "xlsx"):
+        raise ValueError(f"Unsupported export format: {fmt}")
+    if gzip_output and fmt != "csv":
+        raise ValueError("gzip is only supported for CSV exports.")
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    conn = get_connection(tenant_id)
+    start = time.perf_counter()
+    try:
+        if fmt == "xlsx":
+            rows = write_xlsx(conn, path, batch_size, progress)
+        elif gzip_output:
+            with gzip.open(path, "wt", newline="", encoding="utf-8") as f:
+                rows = write_csv(conn, f, batch_size, progress)
+        else:
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                rows = write_csv(conn, f, batch_size, progress)
+    finally:
+        conn.close()
+    seconds = time.perf_counter() - start
+
+    return {
+        "path": path,
+        "rows": rows,
+        "seconds": seconds,
+        "rows_per_sec": rows / seconds if seconds > 0 else float(rows),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export the governance / audit report.")
+    parser.add_argument("out", help="Output file path")
+    parser.add_argument("--format", choices=["csv", "xlsx"], default="csv")
+    parser.add_argument("--gzip", action="store_true", help="gzip the CSV on the fly")
+    parser.add_argument("--tenant", default=None, help="Tenant id (default: shared DB)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = parser.parse_args()
+
+    stats = export_governance(
+        args.out,
+        fmt=args.format,
+        gzip_output=args.gzip,
+        tenant_id=args.tenant,
+        batch_size=args.batch_size,
+        progress=make_progress_reporter(lambda msg: print(f"  {msg}", file=sys.stderr)),
+    )
+    print(
+        f"✅ Exported {stats['rows']:,} rows to {stats['path']} "
+        f"in {stats['seconds']:.1f}s ({stats['rows_per_sec']:,.0f} rows/sec)"
+    )
@@ -0,0 +1,110 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from app.db.database import pooled_connection
+from app.db.tenants import list_tenants
+
+ROLLUP_FIELDS = [
+    "open_prs",
+    "open_rfqs",
+    "total_quotes",
+    "decisions",
+    "deviations",
+    "spend",
+]
+
+
+def tenant_rollup(tenant_id: str) -> dict:
+    """
+    Operator KPIs for one tenant shard.
+    Runs inside a worker process; the worker's pool reuses the shard connection
+    if the same worker gets this tenant again.
+    """
+    with pooled_connection(tenant_id) as conn:
+        return _tenant_rollup(conn, tenant_id)
+
+
+def _tenant_rollup(conn, tenant_id: str) -> dict:
+    cur = conn.cursor()
+
+    cur.execute("""
+    SELECT
+      (SELECT COUNT(*) FROM pr WHERE status='Open')  AS open_prs,
+      (SELECT COUNT(*) FROM rfq WHERE status='Open') AS open_rfqs,
+      (SELECT COUNT(*) FROM quotes)                  AS total_quotes
+    """)
+    counts = dict(cur.fetchone())
+
+    # Deviation = purchase picked someone other than the frozen recommendation
+    cur.execute("""
+    SELECT
+      COUNT(*) AS decisions,
+      COALESCE(SUM(CASE WHEN s.recommended_vendor_id IS NOT NULL
+                         AND d.selected_vendor_id != s.recommended_vendor_id
+                        THEN 1 ELSE 0 END), 0) AS deviations
+    FROM rfq_decision d
+    LEFT JOIN rfq_recommendation_snapshot s ON s.rfq_id = d.rfq_id
+    """)
+    decisions = dict(cur.fetchone())
+
+    # Spend = qty x selected vendor's (lowest) quoted price for each decided RFQ
+    cur.execute("""
+    SELECT COALESCE(SUM(pr.qty * sel.price), 0) AS spend
+    FROM rfq_decision d
+    JOIN rfq ON rfq.rfq_id = d.rfq_id
+    JOIN pr  ON pr.pr_id = rfq.pr_id
+    JOIN (
+      SELECT rfq_id, vendor_id, MIN(price) AS price
+      FROM quotes
+      GROUP BY rfq_id, vendor_id
+    ) sel ON sel.rfq_id = d.rfq_id AND sel.vendor_id = d.selected_vendor_id
+    """)
+    spend = dict(cur.fetchone())
+
+    return {"tenant_id": tenant_id, **counts, **decisions, **spend}
+
+
+def merge_rollups(rows):
+    """
+    Sum per-tenant rollups into one operator-level total and add deviation rates.
+    """
+    total = {"tenant_id": "ALL"}
+    for field in ROLLUP_FIELDS:
+        total[field] = sum(r[field] for r in rows)
+
+    merged = [dict(r) for r in rows] + [total]
+    for r in merged:
+        r["deviation_rate"] = (r["deviations"] / r["decisions"]) if r["decisions"] else 0.0
+    return merged
+
+
+def cross_tenant_rollup(tenant_ids=None, max_workers: int = None):
+    """
+    Fan out tenant_rollup() over all active tenants with a process pool and merge.
+    Each shard is an independent SQLite file, so workers never contend on a lock.
+    Returns a list of dicts (one per tenant, plus an 'ALL' total row last).
+    """
+    if tenant_ids is None:
+        tenant_ids = [t["tenant_id"] for t in list_tenants()]
+    tenant_ids = list(tenant_ids)
+
+    if len(tenant_ids) <= 1:
+        rows = [tenant_rollup(t) for t in tenant_ids]
+    else:
+        workers = min(len(tenant_ids), max_workers or os.cpu_count() or 1)
+        # spawn: workers must not inherit the parent's open SQLite connections
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            rows = list(pool.map(tenant_rollup, tenant_ids))
+
+    return merge_rollups(rows)
+
+
+if __name__ == "__main__":
+    for row in cross_tenant_rollup():
+        print(
+            f"{row['tenant_id']:<20} open PRs={row['open_prs']:<6} "
+            f"open RFQs={row['open_rfqs']:<6} decisions={row['decisions']:<6} "
+            f"deviation={row['deviation_rate']:.1%}  spend={row['spend']:,.2f}"
+        )
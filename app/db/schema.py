@@ -1,11 +1,13 @@
 from app.db.database import get_connection
+from app.db.scorecards import backfill_if_needed
 
-def create_tables():
+def create_tables(tenant_id: str = None):
     """
     Creates all required tables if they don't already exist.
     Run this once at app startup.
+    Tenant shards are bootstrapped lazily on first connection (see get_connection).
     """
-    conn = get_connection()
+    conn = get_connection(tenant_id)
     cur = conn.cursor()
 
     # 1) Raw Material master
@@ -100,5 +102,81 @@ def create_tables():
     )
     """)
 
+    # 8) Frontier / shortlist frozen with the snapshot (quotes worth showing for an RFQ)
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS rfq_recommendation_frontier (
+        rfq_id INTEGER NOT NULL,
+        quote_id INTEGER NOT NULL,
+        vendor_id INTEGER NOT NULL,
+        final_score REAL,
+        on_frontier INTEGER DEFAULT 0,  -- 1 = not dominated on price / lead time / risk
+        shortlist_rank INTEGER,         -- 1..K by final_score, NULL if outside top-K
+        created_on TEXT DEFAULT (datetime('now')),
+        FOREIGN KEY (rfq_id) REFERENCES rfq_recommendation_snapshot(rfq_id),
+        FOREIGN KEY (quote_id) REFERENCES quotes(quote_id),
+        FOREIGN KEY (vendor_id) REFERENCES vendors(vendor_id),
+        UNIQUE (rfq_id, quote_id)
+    )
+    """)
+
+    # 9) Vendor daily stats - compact per-day counters, updated on each quote / decision write
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS vendor_daily_stats (
+        vendor_id INTEGER NOT NULL,
+        day TEXT NOT NULL,               -- YYYY-MM-DD
+        quotes INTEGER DEFAULT 0,
+        lead_time_sum REAL DEFAULT 0,
+        decisions INTEGER DEFAULT 0,     -- decided RFQs the vendor quoted on
+        wins INTEGER DEFAULT 0,
+        cheapest INTEGER DEFAULT 0,
+        cheapest_not_selected INTEGER DEFAULT 0,
+        rank_1 INTEGER DEFAULT 0,        -- price rank within the RFQ
+        rank_2 INTEGER DEFAULT 0,
+        rank_3_plus INTEGER DEFAULT 0,
+        PRIMARY KEY (vendor_id, day),
+        FOREIGN KEY (vendor_id) REFERENCES vendors(vendor_id)
+    )
+    """)
+
+    # 10) What each decision added to vendor_daily_stats (so a changed decision can be undone)
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS vendor_decision_outcome (
+        rfq_id INTEGER NOT NULL,
+        vendor_id INTEGER NOT NULL,
+        day TEXT NOT NULL,
+        won INTEGER DEFAULT 0,
+        cheapest INTEGER DEFAULT 0,
+        price_rank INTEGER NOT NULL,
+        PRIMARY KEY (rfq_id, vendor_id),
+        FOREIGN KEY (rfq_id) REFERENCES rfq_decision(rfq_id),
+        FOREIGN KEY (vendor_id) REFERENCES vendors(vendor_id)
+    )
+    """)
+
+    # 11) Vendor scorecard - one row per vendor per rolling window (30 / 90 / 365 days)
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS vendor_scorecard (
+        vendor_id INTEGER NOT NULL,
+        window_days INTEGER NOT NULL,
+        as_of TEXT NOT NULL,             -- YYYY-MM-DD the window ends on
+        quotes INTEGER DEFAULT 0,
+        avg_lead_time_days REAL,
+        decisions INTEGER DEFAULT 0,
+        wins INTEGER DEFAULT 0,
+        win_rate REAL,
+        cheapest INTEGER DEFAULT 0,
+        cheapest_not_selected INTEGER DEFAULT 0,
+        rank_1 INTEGER DEFAULT 0,
+        rank_2 INTEGER DEFAULT 0,
+        rank_3_plus INTEGER DEFAULT 0,
+        updated_on TEXT DEFAULT (datetime('now')),
+        PRIMARY KEY (vendor_id, window_days),
+        FOREIGN KEY (vendor_id) REFERENCES vendors(vendor_id)
+    )
+    """)
+
+    # DBs created before scorecards existed: fill the stats tables from history once
+    backfill_if_needed(cur)
+
     conn.commit()
     conn.close()
\ No newline at end of file
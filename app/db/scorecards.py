@@ -0,0 +1,283 @@
+import argparse
+
+from app.db.database import get_connection
+
+WINDOWS = (30, 90, 365)
+
+DAILY_COUNTERS = (
+    "quotes",
+    "lead_time_sum",
+    "decisions",
+    "wins",
+    "cheapest",
+    "cheapest_not_selected",
+    "rank_1",
+    "rank_2",
+    "rank_3_plus",
+)
+
+
+def _today(cur) -> str:
+    # Same clock (UTC) as the created_on defaults
+    cur.execute("SELECT date('now') AS d")
+    return cur.fetchone()["d"]
+
+
+def _add_daily(cur, vendor_id: int, day: str, **deltas):
+    """
+    Add (or subtract, with negative deltas) counters on one vendor/day bucket.
+    """
+    cols = [c for c in DAILY_COUNTERS if c in deltas]
+    cur.execute(
+        f"""
+        INSERT INTO vendor_daily_stats (vendor_id, day, {", ".join(cols)})
+        VALUES (?, ?, {", ".join("?" for _ in cols)})
+        ON CONFLICT(vendor_id, day) DO UPDATE SET
+          {", ".join(f"{c}={c}+excluded.{c}" for c in cols)}
+        """,
+        (vendor_id, day, *[deltas[c] for c in cols])
+    )
+
+
+def refresh_scorecard(cur, vendor_id: int, today: str = None):
+    """
+    Rebuild one vendor's scorecard rows from its daily buckets.
+    Cost is bounded by the largest window (<= 365 buckets), not by total history.
+    """
+    today = today or _today(cur)
+
+    for window in WINDOWS:
+        cur.execute(
+            """
+            INSERT INTO vendor_scorecard (
+              vendor_id, window_days, as_of, quotes, avg_lead_time_days, decisions, wins, win_rate,
+              cheapest, cheapest_not_selected, rank_1, rank_2, rank_3_plus
+            )
+            SELECT
+              ?, ?, ?,
+              COALESCE(SUM(quotes), 0),
+              SUM(lead_time_sum) / NULLIF(SUM(quotes), 0),
+              COALESCE(SUM(decisions), 0),
+              COALESCE(SUM(wins), 0),
+              CAST(SUM(wins) AS REAL) / NULLIF(SUM(decisions), 0),
+              COALESCE(SUM(cheapest), 0),
+              COALESCE(SUM(cheapest_not_selected), 0),
+              COALESCE(SUM(rank_1), 0),
+              COALESCE(SUM(rank_2), 0),
+              COALESCE(SUM(rank_3_plus), 0)
+            FROM vendor_daily_stats
+            WHERE vendor_id = ? AND day > date(?, ?)
+            ON CONFLICT(vendor_id, window_days) DO UPDATE SET
+              as_of=excluded.as_of,
+              quotes=excluded.quotes,
+              avg_lead_time_days=excluded.avg_lead_time_days,
+              decisions=excluded.decisions,
+              wins=excluded.wins,
+              win_rate=excluded.win_rate,
+              cheapest=excluded.cheapest,
+              cheapest_not_selected=excluded.cheapest_not_selected,
+              rank_1=excluded.rank_1,
+              rank_2=excluded.rank_2,
+              rank_3_plus=excluded.rank_3_plus,
+              updated_on=datetime('now')
+            """,
+            (vendor_id, window, today, vendor_id, today, f"-{window} days")
+        )
+
+
+def record_quote(cur, vendor_id: int, lead_time_days: float, day: str = None, refresh: bool = True):
+    """
+    Call in the same transaction as a quote INSERT.
+    """
+    day = day or _today(cur)
+    _add_daily(cur, vendor_id, day, quotes=1, lead_time_sum=lead_time_days)
+    if refresh:
+        refresh_scorecard(cur, vendor_id)
+
+
+def _apply_outcome(cur, row, sign: int):
+    rank = row["price_rank"]
+    _add_daily(
+        cur,
+        row["vendor_id"],
+        row["day"],
+        decisions=sign,
+        wins=sign * row["won"],
+        cheapest=sign * row["cheapest"],
+        cheapest_not_selected=sign * (row["cheapest"] and not row["won"]),
+        rank_1=sign * (rank == 1),
+        rank_2=sign * (rank == 2),
+        rank_3_plus=sign * (rank >= 3),
+    )
+
+
+def record_decision(cur, rfq_id: int, refresh: bool = True):
+    """
+    Call in the same transaction as an rfq_decision (+ snapshot) write.
+    Undoes whatever an earlier decision on this RFQ contributed, then adds the current one.
+    Touches only the vendors that quoted on this RFQ.
+    """
+    cur.execute(
+        "SELECT rfq_id, vendor_id, day, won, cheapest, price_rank FROM vendor_decision_outcome WHERE rfq_id = ?",
+        (rfq_id,)
+    )
+    old = [dict(r) for r in cur.fetchall()]
+    for row in old:
+        _apply_outcome(cur, row, -1)
+    cur.execute("DELETE FROM vendor_decision_outcome WHERE rfq_id = ?", (rfq_id,))
+
+    cur.execute(
+        """
+        SELECT d.selected_vendor_id, date(d.created_on) AS day, s.cheapest_vendor_id
+        FROM rfq_decision d
+        LEFT JOIN rfq_recommendation_snapshot s ON s.rfq_id = d.rfq_id
+        WHERE d.rfq_id = ?
+        """,
+        (rfq_id,)
+    )
+    decision = cur.fetchone()
+
+    new = []
+    if decision is not None:
+        # Each vendor's best price on this RFQ, dense-ranked
+        cur.execute(
+            """
+            SELECT vendor_id, MIN(price) AS price
+            FROM quotes
+            WHERE rfq_id = ?
+            GROUP BY vendor_id
+            ORDER BY price ASC
+            """,
+            (rfq_id,)
+        )
+        rank, last_price = 0, None
+        for q in cur.fetchall():
+            if q["price"] != last_price:
+                rank += 1
+                last_price = q["price"]
+            if decision["cheapest_vendor_id"] is not None:
+                is_cheapest = q["vendor_id"] == decision["cheapest_vendor_id"]
+            else:
+                is_cheapest = rank == 1
+            new.append({
+                "rfq_id": rfq_id,
+                "vendor_id": q["vendor_id"],
+                "day": decision["day"],
+                "won": int(q["vendor_id"] == decision["selected_vendor_id"]),
+                "cheapest": int(is_cheapest),
+                "price_rank": rank,
+            })
+
+    for row in new:
+        cur.execute(
+            """
+            INSERT INTO vendor_decision_outcome (rfq_id, vendor_id, day, won, cheapest, price_rank)
+            VALUES (:rfq_id, :vendor_id, :day, :won, :cheapest, :price_rank)
+            """,
+            row
+        )
+        _apply_outcome(cur, row, +1)
+
+    if refresh:
+        today = _today(cur)
+        for vendor_id in {r["vendor_id"] for r in old + new}:
+            refresh_scorecard(cur, vendor_id, today)
+
+
+def get_scorecards(conn, vendor_ids):
+    """
+    Scorecard rows (one per window) for the given vendors.
+    Rows whose window ended before today are refreshed first, so numbers don't go stale
+    for vendors with no recent activity.
+    """
+    vendor_ids = [int(v) for v in vendor_ids]
+    if not vendor_ids:
+        return []
+
+    cur = conn.cursor()
+    today = _today(cur)
+    marks = ", ".join("?" for _ in vendor_ids)
+
+    cur.execute(
+        f"""
+        SELECT vendor_id FROM vendors
+        WHERE vendor_id IN ({marks})
+          AND (SELECT COUNT(*) FROM vendor_scorecard sc
+               WHERE sc.vendor_id = vendors.vendor_id AND sc.as_of = ?) < ?
+        """,
+        (*vendor_ids, today, len(WINDOWS))
+    )
+    stale = [r["vendor_id"] for r in cur.fetchall()]
+    for vendor_id in stale:
+        refresh_scorecard(cur, vendor_id, today)
+    if stale:
+        conn.commit()
+
+    cur.execute(
+        f"""
+        SELECT sc.*, v.vendor_name, v.risk_rating
+        FROM vendor_scorecard sc
+        JOIN vendors v ON v.vendor_id = sc.vendor_id
+        WHERE sc.vendor_id IN ({marks})
+        ORDER BY sc.vendor_id, sc.window_days
+        """,
+        vendor_ids
+    )
+    return [dict(r) for r in cur.fetchall()]
+
+
+def rebuild_scorecards(tenant_id: str = None):
+    """
+    Backfill all stats from quotes / decisions (for DBs created before scorecards existed).
+    Normal operation never needs this - writes keep the tables up to date.
+    """
+    conn = get_connection(tenant_id)
+    _rebuild(conn.cursor())
+    conn.commit()
+    conn.close()
+
+
+def backfill_if_needed(cur):
+    """
+    Called from create_tables(): an existing DB that has quotes but no stats yet
+    (created before scorecards existed) gets a one-time rebuild.
+    """
+    cur.execute("""
+    SELECT
+      EXISTS(SELECT 1 FROM quotes) AS has_quotes,
+      EXISTS(SELECT 1 FROM vendor_daily_stats) AS has_stats
+    """)
+    row = cur.fetchone()
+    if row["has_quotes"] and not row["has_stats"]:
+        _rebuild(cur)
+
+
+def _rebuild(cur):
+    cur.execute("DELETE FROM vendor_scorecard")
+    cur.execute("DELETE FROM vendor_decision_outcome")
+    cur.execute("DELETE FROM vendor_daily_stats")
+
+    cur.execute("""
+    INSERT INTO vendor_daily_stats (vendor_id, day, quotes, lead_time_sum)
+    SELECT vendor_id, date(created_on), COUNT(*), SUM(lead_time_days)
+    FROM quotes
+    GROUP BY vendor_id, date(created_on)
+    """)
+
+    cur.execute("SELECT rfq_id FROM rfq_decision")
+    for row in cur.fetchall():
+        record_decision(cur, row["rfq_id"], refresh=False)
+
+    today = _today(cur)
+    cur.execute("SELECT vendor_id FROM vendors")
+    for row in cur.fetchall():
+        refresh_scorecard(cur, row["vendor_id"], today)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild vendor scorecards from history.")
+    parser.add_argument("--tenant", default=None, help="Tenant id (default: shared DB)")
+    args = parser.parse_args()
+
+    rebuild_scorecards(args.tenant)
+    print("✅ Vendor scorecards rebuilt.")
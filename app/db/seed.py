@@ -1,11 +1,12 @@
 from app.db.database import get_connection
+from app.db.scorecards import record_quote
 
-def is_seeded():
+def is_seeded(tenant_id: str = None):
     """
     Check if vendors table already has data.
     If yes, we do not seed again.
     """
-    conn = get_connection()
+    conn = get_connection(tenant_id)
     cur = conn.cursor()
 
     cur.execute("SELECT COUNT(*) as count FROM vendors")
@@ -16,11 +17,11 @@ def is_seeded():
     return row["count"] > 0
 
 
-def seed_demo_data():
+def seed_demo_data(tenant_id: str = None):
     """
     Insert demo data into tables.
     """
-    conn = get_connection()
+    conn = get_connection(tenant_id)
     cur = conn.cursor()
 
     print("Seeding demo data...")
@@ -101,6 +102,9 @@ def seed_demo_data():
         quotes
     )
 
+    # Keep vendor scorecards in step with quote writes
+    for q in quotes:
+        record_quote(cur, q[1], q[3])
 
     conn.commit()
     conn.close()
@@ -0,0 +1,103 @@
+from app.db.database import (
+    close_pools,
+    get_registry_connection,
+    tenant_db_path,
+    validate_tenant_id,
+)
+
+
+def create_registry():
+    """
+    Creates the tenant registry table if it doesn't already exist.
+    The registry lives in its own small DB; business data lives in per-tenant shards.
+    """
+    conn = get_registry_connection()
+    cur = conn.cursor()
+
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS tenants (
+        tenant_id TEXT PRIMARY KEY,
+        tenant_name TEXT NOT NULL,
+        db_file TEXT NOT NULL,
+        active INTEGER DEFAULT 1, -- 0 = No, 1 = Yes
+        created_on TEXT DEFAULT (datetime('now'))
+    )
+    """)
+
+    conn.commit()
+    conn.close()
+
+
+def register_tenant(tenant_id: str, tenant_name: str):
+    """
+    Add a tenant (or update its name). The shard file and its tables are created
+    lazily on the first get_connection(tenant_id).
+    """
+    validate_tenant_id(tenant_id)
+    create_registry()
+
+    conn = get_registry_connection()
+    cur = conn.cursor()
+    cur.execute(
+        """
+        INSERT INTO tenants (tenant_id, tenant_name, db_file)
+        VALUES (?, ?, ?)
+        ON CONFLICT(tenant_id) DO UPDATE SET
+          tenant_name=excluded.tenant_name,
+          active=1
+        """,
+        (tenant_id, tenant_name, tenant_db_path(tenant_id).name)
+    )
+    conn.commit()
+    conn.close()
+
+
+def deactivate_tenant(tenant_id: str):
+    """
+    Hide a tenant from routing and rollups. The shard file is kept.
+    """
+    create_registry()
+
+    conn = get_registry_connection()
+    conn.execute("UPDATE tenants SET active=0 WHERE tenant_id = ?", (tenant_id,))
+    conn.commit()
+    conn.close()
+
+    # Drop this process's pooled connections so they can't be reused
+    close_pools(tenant_id)
+
+
+def list_tenants(active_only: bool = True):
+    """
+    Return registered tenants as a list of dicts, ordered by tenant_id.
+    """
+    create_registry()
+
+    conn = get_registry_connection()
+    cur = conn.cursor()
+    sql = "SELECT tenant_id, tenant_name, db_file, active, created_on FROM tenants"
+    if active_only:
+        sql += " WHERE active = 1"
+    cur.execute(sql + " ORDER BY tenant_id")
+    rows = [dict(row) for row in cur.fetchall()]
+    conn.close()
+
+    return rows
+
+
+def get_active_tenant(tenant_id: str):
+    """
+    Registry row (dict) for an active tenant, or None if unknown / deactivated.
+    """
+    create_registry()
+
+    conn = get_registry_connection()
+    cur = conn.cursor()
+    cur.execute(
+        "SELECT tenant_id, tenant_name, db_file, active, created_on FROM tenants WHERE tenant_id = ? AND active = 1",
+        (tenant_id,)
+    )
+    row = cur.fetchone()
+    conn.close()
+
+    return dict(row) if row else None
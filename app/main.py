@@ -1,14 +1,19 @@
 import streamlit as st
 from app.db.schema import create_tables
 from app.db.seed import is_seeded, seed_demo_data
+from app.tenant_ui import select_tenant
 
 st.set_page_config(page_title="ProcureLive", layout="wide")
 
+# Tenant routing: each registered tenant has its own DB shard.
+# No tenants registered -> single shared DB (development).
+tenant_id = select_tenant()
+
 # Ensure DB + tables exist
-create_tables()
+create_tables(tenant_id)
 
-# Seed demo data only if empty (development)
-if not is_seeded():
+# Seed demo data only if empty - shared dev DB only, never a tenant's shard
+if tenant_id is None and not is_seeded():
     seed_demo_data()
 
 st.title("ProcureLive (Prototype)")
@@ -1,13 +1,20 @@
+import tempfile
+from pathlib import Path
+
 import streamlit as st
 import pandas as pd
-from app.db.database import get_connection
+from app.db.database import acquire_connection, release_connection
+from app.db.export import GOVERNANCE_QUERY, export_governance, make_progress_reporter
+from app.ranking import DEFAULT_TOP_K, frontier_and_shortlist
+from app.tenant_ui import select_tenant
 
 st.set_page_config(page_title="CMD Dashboard", layout="wide")
 
 st.title("Dashboard")
 st.caption("Live procurement governance: system recommendation vs purchase decision")
 
-conn = get_connection()
+tenant_id = select_tenant()
+conn = acquire_connection(tenant_id)
 
 # KPI cards
 k1 = pd.read_sql_query("SELECT COUNT(*) as cnt FROM pr WHERE status='Open'", conn)["cnt"][0]
@@ -45,35 +52,11 @@ ORDER BY rfq.rfq_id, q.price ASC
 """
 
 df = pd.read_sql_query(query, conn)
-conn.close()
 
 st.subheader("Compact Governance View (System vs Purchase)")
-conn = get_connection()
-cmd_df = pd.read_sql_query(
-    """
-    SELECT
-      rfq.rfq_id,
-      pr.pr_id,
-      rm.rm_name,
-      vcheap.vendor_name AS cheapest_vendor,
-      vrec.vendor_name   AS recommended_vendor,
-      vsel.vendor_name   AS selected_vendor,
-      d.selected_by,
-      d.override_reason,
-      d.created_on AS decision_time
-    FROM rfq
-    JOIN pr ON rfq.pr_id = pr.pr_id
-    JOIN rm_master rm ON pr.rm_id = rm.rm_id
-    LEFT JOIN rfq_recommendation_snapshot s ON s.rfq_id = rfq.rfq_id
-    LEFT JOIN vendors vcheap ON s.cheapest_vendor_id = vcheap.vendor_id
-    LEFT JOIN vendors vrec   ON s.recommended_vendor_id = vrec.vendor_id
-    LEFT JOIN rfq_decision d ON d.rfq_id = rfq.rfq_id
-    LEFT JOIN vendors vsel   ON d.selected_vendor_id = vsel.vendor_id
-    ORDER BY rfq.rfq_id DESC
-    """,
-    conn
-)
-conn.close()
+# Same query (and deviation rule) as the governance report export
+cmd_df = pd.read_sql_query(GOVERNANCE_QUERY, conn)
+release_connection(conn, tenant_id)
 
 if cmd_df.empty:
     st.info("No decisions/snapshots saved yet. Use 'Make Decision' page to record selection.")
@@ -91,12 +74,8 @@ else:
     if rfq_filter != "All":
         view = view[view["rfq_id"] == int(rfq_filter)]
 
-    view["deviation"] = view.apply(
-        lambda r: (
-            "⏳ Pending" if pd.isna(r["selected_vendor"])
-            else ("✅ Match" if r["selected_vendor"] == r["recommended_vendor"] else "⚠️ Deviated")
-        ),
-        axis=1
+    view["deviation"] = view["deviation"].map(
+        {"Pending": "⏳ Pending", "Match": "✅ Match", "Deviated": "⚠️ Deviated"}
     )
 
     st.dataframe(
@@ -117,6 +96,38 @@ else:
         use_container_width=True
     )
 
+    # Full export (streams from the DB to a temp file, not from cmd_df)
+    with st.expander("Export governance report (CSV / XLSX)", expanded=False):
+        st.caption(
+            "The download button holds the finished file in server memory. "
+            "For very large exports use `python -m app.db.export` instead."
+        )
+        eA, eB = st.columns(2)
+        with eA:
+            export_fmt = st.selectbox("Format", options=["csv", "xlsx"])
+        with eB:
+            export_gzip = st.checkbox("gzip (CSV only)", value=False, disabled=export_fmt != "csv")
+
+        if st.button("Prepare export"):
+            suffix = f".{export_fmt}" + (".gz" if export_gzip and export_fmt == "csv" else "")
+            # Private file per request: never shared between sessions / tenants
+            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+                out_path = Path(tmp.name)
+            progress_text = st.empty()
+            try:
+                stats = export_governance(
+                    out_path,
+                    fmt=export_fmt,
+                    gzip_output=export_gzip and export_fmt == "csv",
+                    tenant_id=tenant_id,
+                    progress=make_progress_reporter(progress_text.caption),
+                )
+                progress_text.empty()
+                st.caption(f"{stats['rows']:,} rows in {stats['seconds']:.1f}s ({stats['rows_per_sec']:,.0f} rows/sec)")
+                st.download_button("Download report", data=out_path.read_bytes(), file_name=f"governance_report{suffix}")
+            finally:
+                out_path.unlink(missing_ok=True)
+
 st.divider()
 
 # ---------------------------
@@ -179,9 +190,11 @@ recommended = (
 # ---------------------------
 
 # Trust panel (always available, not cluttering)
+# Only the Pareto frontier + top-K per RFQ (one sort + one sweep over all RFQs)
 with st.expander("Why Recommended (Score Breakdown)", expanded=False):
+    st.caption(f"Per RFQ: quotes not beaten on price, lead time and risk at once, plus the top {DEFAULT_TOP_K} by score.")
     st.dataframe(
-        df_sc[
+        frontier_and_shortlist(df_sc, k=DEFAULT_TOP_K)[
             [
                 "rfq_id",
                 "rm_name",
@@ -193,8 +206,10 @@ with st.expander("Why Recommended (Score Breakdown)", expanded=False):
                 "lt_score",
                 "risk_penalty",
                 "final_score",
+                "on_frontier",
+                "shortlist_rank",
             ]
-        ].sort_values(["rfq_id", "final_score"], ascending=[True, False]),
+        ],
         use_container_width=True
     )
 
@@ -1,6 +1,10 @@
 import streamlit as st
 import pandas as pd
-from app.db.database import get_connection
+from app.db.database import acquire_connection, release_connection
+from app.db.decisions import save_decision
+from app.db.scorecards import WINDOWS, get_scorecards
+from app.ranking import DEFAULT_TOP_K, frontier_and_shortlist
+from app.tenant_ui import select_tenant
 
 def normalize_inverse(series: pd.Series) -> pd.Series:
     min_v = float(series.min())
@@ -12,18 +16,22 @@ def normalize_inverse(series: pd.Series) -> pd.Series:
 def risk_penalty(risk: str) -> float:
     return {"Low": 0.0, "Medium": -15.0, "High": -40.0}.get(risk, -15.0)
 
-def compute_cheapest_and_recommended(quotes: pd.DataFrame):
-    # cheapest
-    cheapest_row = quotes.sort_values("price", ascending=True).iloc[0]
-    cheapest_vendor_id = int(cheapest_row["vendor_id"])
-
-    # recommended (same scoring as dashboard)
+def score_quotes(quotes: pd.DataFrame) -> pd.DataFrame:
+    # same scoring as dashboard
     df_sc = quotes.copy()
     df_sc["price_score"] = normalize_inverse(df_sc["price"])
     df_sc["lt_score"] = normalize_inverse(df_sc["lead_time_days"])
     df_sc["risk_penalty"] = df_sc["risk_rating"].apply(risk_penalty)
     df_sc["final_score"] = 0.65 * df_sc["price_score"] + 0.35 * df_sc["lt_score"] + df_sc["risk_penalty"]
+    return df_sc
+
+def compute_cheapest_and_recommended(quotes: pd.DataFrame):
+    # cheapest
+    cheapest_row = quotes.sort_values("price", ascending=True).iloc[0]
+    cheapest_vendor_id = int(cheapest_row["vendor_id"])
 
+    # recommended
+    df_sc = score_quotes(quotes)
     rec_row = df_sc.sort_values("final_score", ascending=False).iloc[0]
     recommended_vendor_id = int(rec_row["vendor_id"])
 
@@ -48,7 +56,8 @@ st.set_page_config(page_title="Make Decision", layout="wide")
 st.title("Make Decision (Purchase / Approver)")
 st.caption("Select final vendor for an RFQ and log decision with audit trail.")
 
-conn = get_connection()
+tenant_id = select_tenant()
+conn = acquire_connection(tenant_id)
 
 # Get RFQs
 rfq_df = pd.read_sql_query(
@@ -64,7 +73,7 @@ rfq_df = pd.read_sql_query(
 
 if rfq_df.empty:
     st.warning("No RFQs found.")
-    conn.close()
+    release_connection(conn, tenant_id)
     st.stop()
 
 rfq_options = rfq_df["rfq_id"].tolist()
@@ -78,7 +87,7 @@ st.info(
 # Quotes for this RFQ
 quotes_df = pd.read_sql_query(
     """
-    SELECT q.quote_id, v.vendor_id, v.vendor_name, v.risk_rating, q.price, q.lead_time_days, q.payment_terms, q.validity_days, q.notes
+    SELECT q.rfq_id, q.quote_id, v.vendor_id, v.vendor_name, v.risk_rating, q.price, q.lead_time_days, q.payment_terms, q.validity_days, q.notes
     FROM quotes q
     JOIN vendors v ON q.vendor_id = v.vendor_id
     WHERE q.rfq_id = ?
@@ -88,8 +97,54 @@ quotes_df = pd.read_sql_query(
     params=(selected_rfq,)
 )
 
-st.subheader("Quotes")
-st.dataframe(quotes_df, use_container_width=True)
+# Frontier (not beaten on price, lead time and risk at once) + top-K by score
+frontier_df = frontier_and_shortlist(score_quotes(quotes_df), k=DEFAULT_TOP_K)
+
+st.subheader(f"Quotes (Pareto Frontier + Top {DEFAULT_TOP_K})")
+st.caption(f"Showing {len(frontier_df)} of {len(quotes_df)} quotes.")
+st.dataframe(
+    frontier_df[
+        [
+            "vendor_name",
+            "risk_rating",
+            "price",
+            "lead_time_days",
+            "final_score",
+            "on_frontier",
+            "shortlist_rank",
+            "payment_terms",
+            "notes",
+        ]
+    ],
+    use_container_width=True
+)
+
+# Vendor scorecards (rolling windows, from past quotes / decisions)
+with st.expander("Vendor Scorecards", expanded=False):
+    window = st.radio("Window (days)", options=list(WINDOWS), index=WINDOWS.index(90), horizontal=True)
+    sc_df = pd.DataFrame(get_scorecards(conn, quotes_df["vendor_id"].unique().tolist()))
+    if sc_df.empty:
+        st.info("No scorecard data yet.")
+    else:
+        st.dataframe(
+            sc_df[sc_df["window_days"] == window][
+                [
+                    "vendor_name",
+                    "risk_rating",
+                    "quotes",
+                    "avg_lead_time_days",
+                    "decisions",
+                    "wins",
+                    "win_rate",
+                    "rank_1",
+                    "rank_2",
+                    "rank_3_plus",
+                    "cheapest",
+                    "cheapest_not_selected",
+                ]
+            ],
+            use_container_width=True
+        )
 
 cheapest_vendor_id, recommended_vendor_id, weights = compute_cheapest_and_recommended(quotes_df)
 
@@ -122,45 +177,33 @@ if st.button("Save Decision"):
             ok, msg = validate_override_reason(override_reason, min_words=5, max_words=50)
             if not ok:
                 st.error(msg)
+                release_connection(conn, tenant_id)
                 st.stop()
 
         # Enforce override reason if deviating
         if selected_vendor_id != recommended_vendor_id and not override_reason.strip():
             st.error("Override reason is required because selected vendor differs from system recommendation.")
         else:
-            cur = conn.cursor()
-
-            # Save/Update snapshot
-            cur.execute(
-                """
-                INSERT INTO rfq_recommendation_snapshot (rfq_id, recommended_vendor_id, cheapest_vendor_id, weights)
-                VALUES (?, ?, ?, ?)
-                ON CONFLICT(rfq_id) DO UPDATE SET
-                  recommended_vendor_id=excluded.recommended_vendor_id,
-                  cheapest_vendor_id=excluded.cheapest_vendor_id,
-                  weights=excluded.weights,
-                  created_on=datetime('now')
-                """,
-                (int(selected_rfq), int(recommended_vendor_id), int(cheapest_vendor_id), weights)
-            )
-
-            # Save/Update decision
-            cur.execute(
-                """
-                INSERT INTO rfq_decision (rfq_id, selected_vendor_id, selected_by, override_reason)
-                VALUES (?, ?, ?, ?)
-                ON CONFLICT(rfq_id) DO UPDATE SET
-                  selected_vendor_id=excluded.selected_vendor_id,
-                  selected_by=excluded.selected_by,
-                  override_reason=excluded.override_reason,
-                  created_on=datetime('now')
-                """,
-                (
-                    int(selected_rfq),
-                    int(selected_vendor_id),
-                    selected_by.strip(),
-                    override_reason.strip() if override_reason else None
-                )
+            # Decision + snapshot + frozen frontier + scorecards, in one transaction
+            save_decision(
+                conn.cursor(),
+                int(selected_rfq),
+                int(selected_vendor_id),
+                selected_by.strip(),
+                override_reason.strip() if override_reason else None,
+                int(recommended_vendor_id),
+                int(cheapest_vendor_id),
+                weights,
+                frontier_rows=[
+                    (
+                        int(r["quote_id"]),
+                        int(r["vendor_id"]),
+                        float(r["final_score"]),
+                        int(bool(r["on_frontier"])),
+                        None if pd.isna(r["shortlist_rank"]) else int(r["shortlist_rank"]),
+                    )
+                    for _, r in frontier_df.iterrows()
+                ],
             )
 
             conn.commit()
@@ -250,4 +293,27 @@ st.dataframe(check_df, use_container_width=True)
 st.write("**Snapshot:**")
 st.dataframe(snap_df, use_container_width=True)          
 
-conn.close()
\ No newline at end of file
+frozen_df = pd.read_sql_query(
+    """
+    SELECT
+      v.vendor_name,
+      q.price,
+      q.lead_time_days,
+      f.final_score,
+      f.on_frontier,
+      f.shortlist_rank,
+      f.created_on
+    FROM rfq_recommendation_frontier f
+    JOIN vendors v ON f.vendor_id = v.vendor_id
+    JOIN quotes q  ON f.quote_id = q.quote_id
+    WHERE f.rfq_id = ?
+    ORDER BY f.final_score DESC
+    """,
+    conn,
+    params=(int(selected_rfq),)
+)
+
+st.write("**Frozen frontier + shortlist (at decision time):**")
+st.dataframe(frozen_df, use_container_width=True)
+
+release_connection(conn, tenant_id)
\ No newline at end of file
@@ -0,0 +1,119 @@
+import heapq
+
+import pandas as pd
+
+RISK_LEVELS = {"Low": 0, "Medium": 1, "High": 2}
+DEFAULT_TOP_K = 3
+
+
+def pareto_mask(groups, price, lead, risk):
+    """
+    True per quote if no other quote in its group dominates it on price, lead and risk (lower is better).
+    Inputs are lists sorted by (group, price, lead, risk); risk is an int level.
+    """
+    n = len(price)
+    levels = (max(risk) + 1) if n else 0
+    mask = [False] * n
+
+    i = 0
+    best_lead = None
+    prev_group = object()
+    while i < n:
+        # best_lead[r]: lowest lead time so far in this group with risk <= r
+        if groups[i] != prev_group:
+            prev_group = groups[i]
+            best_lead = [float("inf")] * levels
+
+        # run of identical (group, price, lead, risk)
+        j = i + 1
+        while (j < n and groups[j] == groups[i] and price[j] == price[i]
+               and lead[j] == lead[i] and risk[j] == risk[i]):
+            j += 1
+
+        on_frontier = best_lead[risk[i]] > lead[i]
+        for k in range(i, j):
+            mask[k] = on_frontier
+
+        for r in range(risk[i], levels):
+            if lead[i] < best_lead[r]:
+                best_lead[r] = lead[i]
+        i = j
+
+    return mask
+
+
+def top_k_positions(groups, scores, k: int = DEFAULT_TOP_K):
+    """
+    Positions of the k highest scores per group, best first, using a bounded heap per group.
+    O(n log k) overall. Returns {group: [position, ...]}.
+    """
+    heaps = {}
+    for pos, (g, s) in enumerate(zip(groups, scores)):
+        heap = heaps.setdefault(g, [])
+        # -pos: on equal score keep the earlier row (same as a stable sort)
+        item = (s, -pos)
+        if len(heap) < k:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+
+    return {g: [-p for _, p in sorted(heap, reverse=True)] for g, heap in heaps.items()}
+
+
+def mark_pareto_frontier(df: pd.DataFrame, group_col: str = "rfq_id") -> pd.Series:
+    """
+    Boolean Series (aligned to df.index): True if the quote is on its RFQ's
+    price / lead time / risk Pareto frontier. One sort, then one row-by-row sweep over all RFQs.
+    """
+    if df.empty:
+        return pd.Series(dtype=bool, index=df.index)
+
+    risk = df["risk_rating"].map(RISK_LEVELS).fillna(RISK_LEVELS["Medium"]).astype(int)
+    ordered = (
+        df[[group_col, "price", "lead_time_days"]]
+        .assign(_risk=risk)
+        .sort_values([group_col, "price", "lead_time_days", "_risk"], kind="mergesort")
+    )
+
+    mask = pareto_mask(
+        ordered[group_col].tolist(),
+        ordered["price"].tolist(),
+        ordered["lead_time_days"].tolist(),
+        ordered["_risk"].tolist(),
+    )
+    return pd.Series(mask, index=ordered.index).reindex(df.index)
+
+
+def rank_top_k(df: pd.DataFrame, k: int = DEFAULT_TOP_K,
+               score_col: str = "final_score", group_col: str = "rfq_id") -> pd.DataFrame:
+    """
+    Top-k quotes per RFQ by score, with a 1-based 'shortlist_rank' column.
+    Ties keep the earlier row first.
+    """
+    positions = top_k_positions(df[group_col].tolist(), df[score_col].tolist(), k)
+
+    rows, ranks = [], []
+    for g in sorted(positions):
+        for rank, pos in enumerate(positions[g], start=1):
+            rows.append(pos)
+            ranks.append(rank)
+
+    out = df.iloc[rows].copy()
+    out["shortlist_rank"] = ranks
+    return out
+
+
+def frontier_and_shortlist(df_sc: pd.DataFrame, k: int = DEFAULT_TOP_K,
+                           group_col: str = "rfq_id") -> pd.DataFrame:
+    """
+    Scored quotes reduced to the ones worth showing: the Pareto frontier plus the top-k.
+    Adds 'on_frontier' and 'shortlist_rank' (NaN if not in the top-k).
+    """
+    df = df_sc.copy()
+    df["on_frontier"] = mark_pareto_frontier(df, group_col)
+
+    shortlist = rank_top_k(df, k, group_col=group_col)
+    df["shortlist_rank"] = shortlist["shortlist_rank"].reindex(df.index)
+
+    keep = df["on_frontier"] | df["shortlist_rank"].notna()
+    return df[keep].sort_values([group_col, "final_score"], ascending=[True, False])
@@ -0,0 +1,29 @@
+import streamlit as st
+
+from app.db.tenants import list_tenants
+
+
+def select_tenant():
+    """
+    Sidebar tenant picker - call at the top of every page.
+    Returns the selected tenant_id, or None when no tenants are registered
+    (single shared DB, development). Pages must never fall back to the shared DB
+    while tenants exist, including when a page URL is opened directly.
+    """
+    tenants = list_tenants()
+    if not tenants:
+        st.session_state["tenant_id"] = None
+        return None
+
+    tenant_names = {t["tenant_id"]: t["tenant_name"] for t in tenants}
+    options = list(tenant_names.keys())
+    current = st.session_state.get("tenant_id")
+
+    # Selection lives in session_state (not widget state) so it survives page switches
+    st.session_state["tenant_id"] = st.sidebar.selectbox(
+        "Tenant",
+        options=options,
+        index=options.index(current) if current in options else 0,
+        format_func=lambda t: tenant_names[t],
+    )
+    return st.session_state["tenant_id"]
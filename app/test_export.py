@@ -0,0 +1,92 @@
+import csv
+import gzip
+
+import app.db.export as export
+from app.db.database import get_connection
+from app.db.export import export_governance, governance_columns
+from app.db.seed import seed_demo_data
+from app.db.tenants import register_tenant
+from app.testing import temp_data_dir
+
+TENANT = "export-test"
+EXTRA_RFQS = 4
+
+
+def _seed_tenant():
+    """
+    Demo data (1 RFQ, with a deviated decision) + a few undecided RFQs. Returns columns.
+    """
+    register_tenant(TENANT, "Export Test")
+    seed_demo_data(TENANT)
+
+    conn = get_connection(TENANT)
+    cur = conn.cursor()
+    cur.execute("INSERT INTO rfq_recommendation_snapshot (rfq_id, recommended_vendor_id, cheapest_vendor_id) VALUES (1, 1, 3)")
+    cur.execute("INSERT INTO rfq_decision (rfq_id, selected_vendor_id, selected_by) VALUES (1, 2, 'Purchase')")
+    cur.executemany("INSERT INTO rfq (pr_id, status) VALUES (1, 'Open')", [()] * EXTRA_RFQS)
+    conn.commit()
+    columns = governance_columns(conn)
+    conn.close()
+    return columns
+
+
+def test_csv_and_gzip_export():
+    with temp_data_dir() as tmp:
+        columns = _seed_tenant()
+        expected_rows = 1 + EXTRA_RFQS
+
+        for name, gz, opener in [("report.csv", False, open), ("report.csv.gz", True, gzip.open)]:
+            path = tmp / name
+            stats = export_governance(path, fmt="csv", gzip_output=gz, tenant_id=TENANT, batch_size=2)
+            assert stats["rows"] == expected_rows
+            assert stats["rows_per_sec"] > 0
+
+            with opener(path, "rt", newline="", encoding="utf-8") as f:
+                rows = list(csv.reader(f))
+            assert rows[0] == columns
+            assert len(rows) - 1 == expected_rows
+
+            deviation = {r[0]: r[columns.index("deviation")] for r in rows[1:]}
+            assert deviation["1"] == "Deviated"
+            assert list(deviation.values()).count("Pending") == EXTRA_RFQS
+
+
+def test_progress_callback_reports_running_totals():
+    with temp_data_dir() as tmp:
+        _seed_tenant()
+        seen = []
+        export_governance(tmp / "report.csv", tenant_id=TENANT, batch_size=2, progress=seen.append)
+        assert seen == [2, 4, 5]
+
+
+def test_xlsx_export_rolls_over_sheets():
+    from openpyxl import load_workbook
+
+    with temp_data_dir() as tmp:
+        columns = _seed_tenant()
+        old_max = export.XLSX_MAX_ROWS
+        export.XLSX_MAX_ROWS = 3  # header + 2 rows per sheet
+        try:
+            path = tmp / "report.xlsx"
+            stats = export_governance(path, fmt="xlsx", tenant_id=TENANT, batch_size=2)
+        finally:
+            export.XLSX_MAX_ROWS = old_max
+
+        assert stats["rows"] == 1 + EXTRA_RFQS
+        wb = load_workbook(path, read_only=True)
+        assert wb.sheetnames == ["Governance", "Governance 2", "Governance 3"]
+
+        data_rows = 0
+        for ws in wb.worksheets:
+            rows = list(ws.iter_rows(values_only=True))
+            assert list(rows[0]) == columns
+            data_rows += len(rows) - 1
+        wb.close()
+        assert data_rows == stats["rows"]
+
+
+if __name__ == "__main__":
+    test_csv_and_gzip_export()
+    test_progress_callback_reports_running_totals()
+    test_xlsx_export_rolls_over_sheets()
+    print("✅ Export tests passed.")
@@ -0,0 +1,66 @@
+import pandas as pd
+
+from app.ranking import mark_pareto_frontier, pareto_mask, rank_top_k, top_k_positions
+
+
+def test_pareto_mask_multiple_rfqs():
+    # sorted by (rfq, price, lead, risk)
+    groups = [1, 1, 1, 2, 2]
+    price = [100, 110, 120, 50, 60]
+    lead = [20, 10, 25, 5, 5]
+    risk = [1, 1, 0, 2, 0]
+    # RFQ 1: 120 is slower and pricier than 100 but lower risk -> still on frontier
+    # RFQ 2: 60/5/Low vs 50/5/High -> both on frontier
+    assert pareto_mask(groups, price, lead, risk) == [True, True, True, True, True]
+
+    risk = [1, 1, 1, 0, 0]
+    # RFQ 1: 120/25/Medium is beaten by 100/20/Medium; RFQ 2: 60/5/Low beaten by 50/5/Low
+    assert pareto_mask(groups, price, lead, risk) == [True, True, False, True, False]
+
+
+def test_pareto_mask_ties_and_identical_quotes():
+    # identical quotes don't dominate each other
+    assert pareto_mask([1, 1], [100, 100], [10, 10], [1, 1]) == [True, True]
+
+    # same price + lead, higher risk is dominated
+    assert pareto_mask([1, 1], [100, 100], [10, 10], [0, 1]) == [True, False]
+
+    # identical pair dominated together by a strictly better quote
+    assert pareto_mask([1, 1, 1], [90, 100, 100], [10, 10, 10], [1, 1, 1]) == [True, False, False]
+
+    # a quote beaten in one RFQ doesn't affect another RFQ
+    assert pareto_mask([1, 2], [100, 200], [10, 20], [0, 1]) == [True, True]
+
+
+def test_top_k_positions_ties_and_groups():
+    groups = [1, 1, 1, 1, 2, 2]
+    scores = [50, 80, 80, 10, 5, 7]
+    # equal scores keep the earlier row first
+    assert top_k_positions(groups, scores, 2) == {1: [1, 2], 2: [5, 4]}
+    assert top_k_positions(groups, scores, 10) == {1: [1, 2, 0, 3], 2: [5, 4]}
+
+
+def test_dataframe_wrappers():
+    df = pd.DataFrame({
+        "rfq_id": [2, 1, 1, 1, 2],
+        "vendor_id": [10, 11, 12, 13, 14],
+        "price": [60, 100, 120, 100, 50],
+        "lead_time_days": [5, 10, 25, 10, 5],
+        "risk_rating": ["Low", "Medium", "Medium", "Medium", "Low"],
+        "final_score": [40.0, 90.0, 10.0, 90.0, 95.0],
+    })
+
+    frontier = mark_pareto_frontier(df)
+    assert frontier.tolist() == [False, True, False, True, True]
+
+    top = rank_top_k(df, k=1)
+    assert top["vendor_id"].tolist() == [11, 14]
+    assert top["shortlist_rank"].tolist() == [1, 1]
+
+
+if __name__ == "__main__":
+    test_pareto_mask_multiple_rfqs()
+    test_pareto_mask_ties_and_identical_quotes()
+    test_top_k_positions_ties_and_groups()
+    test_dataframe_wrappers()
+    print("✅ Ranking tests passed.")
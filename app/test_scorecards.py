@@ -0,0 +1,83 @@
+from app.db.database import get_connection
+from app.db.decisions import save_decision
+from app.db.schema import create_tables
+from app.db.scorecards import get_scorecards, rebuild_scorecards
+from app.db.seed import seed_demo_data
+from app.db.tenants import register_tenant
+from app.testing import temp_data_dir
+
+TENANT = "scorecard-test"
+
+
+def _scorecards(tenant_id):
+    conn = get_connection(tenant_id)
+    cur = conn.cursor()
+    cur.execute("SELECT vendor_id FROM vendors")
+    vendor_ids = [r["vendor_id"] for r in cur.fetchall()]
+    rows = get_scorecards(conn, vendor_ids)
+    conn.close()
+    # updated_on is a timestamp, not a stat
+    return [{k: v for k, v in r.items() if k != "updated_on"} for r in rows]
+
+
+def _decide(tenant_id, selected_vendor_id, recommended_vendor_id, cheapest_vendor_id):
+    conn = get_connection(tenant_id)
+    save_decision(conn.cursor(), 1, selected_vendor_id, "Purchase", None,
+                  recommended_vendor_id, cheapest_vendor_id, "")
+    conn.commit()
+    conn.close()
+
+
+def test_changed_decision_matches_rebuild():
+    with temp_data_dir():
+        register_tenant(TENANT, "Scorecard Test")
+        seed_demo_data(TENANT)
+
+        conn = get_connection(TENANT)
+        cur = conn.cursor()
+        cur.execute("SELECT vendor_id, vendor_name FROM vendors")
+        vmap = {r["vendor_name"]: r["vendor_id"] for r in cur.fetchall()}
+        conn.close()
+
+        healthy = vmap["HealthyChem Pharma Pvt Ltd"]
+        budget = vmap["BudgetBulk Chemicals"]
+        fastdeal = vmap["FastDeal Traders"]
+
+        # Decide, then change the decision
+        _decide(TENANT, budget, healthy, fastdeal)
+        _decide(TENANT, fastdeal, healthy, fastdeal)
+
+        incremental = _scorecards(TENANT)
+        rebuild_scorecards(TENANT)
+        assert incremental == _scorecards(TENANT)
+
+        by_vendor = {r["vendor_id"]: r for r in incremental if r["window_days"] == 30}
+        # only the final decision counts
+        assert by_vendor[budget]["wins"] == 0
+        assert by_vendor[fastdeal]["wins"] == 1
+        assert by_vendor[fastdeal]["cheapest"] == 1
+        assert by_vendor[fastdeal]["cheapest_not_selected"] == 0
+        assert all(r["decisions"] == 1 for r in by_vendor.values())
+        assert all(r["quotes"] == 1 for r in by_vendor.values())
+
+
+def test_create_tables_backfills_existing_quotes():
+    with temp_data_dir():
+        register_tenant(TENANT, "Scorecard Test")
+        seed_demo_data(TENANT)
+
+        # Simulate a DB from before scorecards existed
+        conn = get_connection(TENANT)
+        conn.execute("DELETE FROM vendor_scorecard")
+        conn.execute("DELETE FROM vendor_daily_stats")
+        conn.commit()
+        conn.close()
+
+        create_tables(TENANT)
+        assert all(r["quotes"] == 1 for r in _scorecards(TENANT))
+
+
+if __name__ == "__main__":
+    test_changed_decision_matches_rebuild()
+    test_create_tables_backfills_existing_quotes()
+    print("✅ Scorecard tests passed.")
@@ -0,0 +1,110 @@
+import threading
+
+import app.db.database as database
+from app.db.database import (
+    POOL_SIZE,
+    acquire_connection,
+    get_connection,
+    release_connection,
+    validate_tenant_id,
+)
+from app.db.rollup import merge_rollups
+from app.db.tenants import deactivate_tenant, register_tenant
+from app.testing import temp_data_dir
+
+
+def _raises(exc_type, fn, *args):
+    try:
+        fn(*args)
+    except exc_type:
+        return True
+    return False
+
+
+def test_validate_tenant_id_rejects_unsafe_ids():
+    assert validate_tenant_id("acme-pharma_1") == "acme-pharma_1"
+    for bad in ["../x", "a/b", "Acme", "", "-acme", None, "x" * 64]:
+        assert _raises(ValueError, validate_tenant_id, bad), bad
+
+
+def test_unknown_or_inactive_tenant_is_rejected():
+    with temp_data_dir() as tmp:
+        assert _raises(ValueError, get_connection, "typo_tenant")
+        assert not (tmp / "tenants" / "typo_tenant.db").exists()
+
+        register_tenant("acme", "Acme")
+        get_connection("acme").close()
+        assert (tmp / "tenants" / "acme.db").exists()
+
+        deactivate_tenant("acme")
+        assert _raises(ValueError, get_connection, "acme")
+
+
+def test_concurrent_bootstrap_of_new_shard():
+    with temp_data_dir():
+        register_tenant("race", "Race")
+        errors = []
+
+        def open_and_query():
+            try:
+                conn = get_connection("race")
+                conn.execute("SELECT COUNT(*) FROM vendors").fetchone()
+                conn.close()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=open_and_query) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert not errors, errors
+
+
+def test_pool_reuse_overflow_and_rollback():
+    with temp_data_dir():
+        register_tenant("acme", "Acme")
+
+        conns = [acquire_connection("acme") for _ in range(POOL_SIZE + 2)]
+        assert len({id(c) for c in conns}) == POOL_SIZE + 2
+
+        # uncommitted write is rolled back on release
+        conns[0].execute("INSERT INTO vendors (vendor_name) VALUES ('Uncommitted')")
+        for c in conns:
+            release_connection(c, "acme")
+        assert database._pools["acme"].qsize() == POOL_SIZE
+
+        # pool hands back a pooled connection (LIFO)
+        reused = acquire_connection("acme")
+        assert any(reused is c for c in conns)
+        assert reused.execute("SELECT COUNT(*) FROM vendors").fetchone()[0] == 0
+        release_connection(reused, "acme")
+
+
+def test_merge_rollups_totals_and_deviation_rate():
+    rows = [
+        {"tenant_id": "a", "open_prs": 2, "open_rfqs": 1, "total_quotes": 6,
+         "decisions": 4, "deviations": 1, "spend": 100.0},
+        {"tenant_id": "b", "open_prs": 0, "open_rfqs": 0, "total_quotes": 0,
+         "decisions": 0, "deviations": 0, "spend": 0},
+    ]
+    merged = merge_rollups(rows)
+
+    assert [r["tenant_id"] for r in merged] == ["a", "b", "ALL"]
+    assert merged[0]["deviation_rate"] == 0.25
+    assert merged[1]["deviation_rate"] == 0.0
+    total = merged[-1]
+    assert total["open_prs"] == 2 and total["total_quotes"] == 6
+    assert total["decisions"] == 4 and total["spend"] == 100.0
+    assert total["deviation_rate"] == 0.25
+    # inputs are not modified
+    assert "deviation_rate" not in rows[0]
+
+
+if __name__ == "__main__":
+    test_validate_tenant_id_rejects_unsafe_ids()
+    test_unknown_or_inactive_tenant_is_rejected()
+    test_concurrent_bootstrap_of_new_shard()
+    test_pool_reuse_overflow_and_rollback()
+    test_merge_rollups_totals_and_deviation_rate()
+    print("✅ Tenant tests passed.")
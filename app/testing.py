@@ -0,0 +1,36 @@
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+import app.db.database as database
+
+
+def reset_connection_state():
+    """
+    Forget pooled connections and bootstrapped tenants in this process.
+    """
+    database.close_pools()
+    with database._lock:
+        database._bootstrapped.clear()
+        database._bootstrapping.clear()
+        database._bootstrap_locks.clear()
+
+
+@contextmanager
+def temp_data_dir():
+    """
+    Point the shared DB, tenant shards and registry at a throwaway directory
+    with fresh pool / bootstrap state. Used by the app/test_*.py scripts.
+    """
+    saved = (database.DB_PATH, database.TENANT_DB_DIR, database.REGISTRY_DB_PATH)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        reset_connection_state()
+        database.DB_PATH = tmp / "procurement.db"
+        database.TENANT_DB_DIR = tmp / "tenants"
+        database.REGISTRY_DB_PATH = tmp / "tenant_registry.db"
+        try:
+            yield tmp
+        finally:
+            reset_connection_state()
+            database.DB_PATH, database.TENANT_DB_DIR, database.REGISTRY_DB_PATH = saved